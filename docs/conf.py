@@ -3,6 +3,8 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
+import os
+
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
@@ -13,25 +15,25 @@ author = "Felix Neumärker"
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
+# sphinx.ext.duration is only loaded for profiling: SPHINX_PROFILE=1 sphinx-build ...
 extensions = [
-    "sphinx.ext.autodoc",
-    "sphinx.ext.duration",
+    *(["sphinx.ext.duration"] if os.environ.get("SPHINX_PROFILE") else []),
     "autoapi.extension",
     "sphinx_multiversion",
 ]
 
 autoapi_dirs = ["../src/regfile_generics"]
+autoapi_ignore = ["*/tests/*", "*/__pycache__/*"]
+autoapi_generate_api_docs = True
+autoapi_keep_files = False
+autoapi_root = "autoapi"
 autodoc_typehints = "description"
 autoapi_options = [
     "members",
     "undoc-members",
     "show-inheritance",
     "show-module-summary",
-    "special-members",
-    "imported-members",
 ]
-# autoapi_keep_files = True
-
 # def skip_member(app, what, name, obj, skip, options):
 #    # skip submodules
 #    if (obj.is_private_member):
@@ -43,10 +45,11 @@ autoapi_options = [
 #    sphinx.connect("autoapi-skip-member", skip_member)
 
 # Whitelist pattern for tags (set to None to ignore all tags)
-smv_tag_whitelist = r"^.*$"
+# By default no tags are built, the release build sets SMV_TAGS="^.*$"
+smv_tag_whitelist = os.environ.get("SMV_TAGS", r"^$")
 
 # Whitelist pattern for branches (set to None to ignore all branches)
-smv_branch_whitelist = r"^master$"
+smv_branch_whitelist = os.environ.get("SMV_BRANCHES", r"^master$")
 
 # Whitelist pattern for remotes (set to None to use local branches only)
 smv_remote_whitelist = None
@@ -61,14 +64,14 @@ smv_outputdir_format = "{ref.name}"
 smv_prefer_remote_refs = False
 
 templates_path = ["_templates"]
-exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
+exclude_patterns = ["_build", "Thumbs.db", ".DS_Store", "autoapi/**/*.bak", "**/.ipynb_checkpoints"]
 
 
 # -- Options for HTML output -------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
 
 # html_baseurl = "https://regfile-generics.icglue.org"
-html_theme = "sphinx_rtd_theme"
+html_theme = "alabaster"
 html_static_path = ["_static"]
 html_show_sourcelink = False
-html_css_files = ["custom.css"]
+html_sidebars = {"**": ["about.html", "navigation.html", "searchbox.html", "versions.html"]}
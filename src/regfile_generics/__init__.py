@@ -1,12 +1,46 @@
 """Regfile generics"""
 
-from .regfile import Regfile, RegfileMemAccess, RegisterEntry
-from .regfile_device import (
-    RegfileDev,
-    RegfileDevSimple,
-    RegfileDevSimpleDebug,
-    RegfileDevSubword,
-    RegfileDevSubwordDebug,
-    StringCmdRegfileDevSimple,
-    StringCmdRegfileDevSubword,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .regfile import Regfile, RegfileMemAccess, RegisterEntry
+    from .regfile_device import (
+        RegfileDev,
+        RegfileDevSimple,
+        RegfileDevSimpleDebug,
+        RegfileDevSubword,
+        RegfileDevSubwordDebug,
+        StringCmdRegfileDevSimple,
+        StringCmdRegfileDevSubword,
+    )
+
+_LAZY_EXPORTS = {
+    "Regfile": ".regfile",
+    "RegfileMemAccess": ".regfile",
+    "RegisterEntry": ".regfile",
+    "RegfileDev": ".regfile_device",
+    "RegfileDevSimple": ".regfile_device",
+    "RegfileDevSimpleDebug": ".regfile_device",
+    "RegfileDevSubword": ".regfile_device",
+    "RegfileDevSubwordDebug": ".regfile_device",
+    "StringCmdRegfileDevSimple": ".regfile_device",
+    "StringCmdRegfileDevSubword": ".regfile_device",
+}
+
+__all__ = tuple(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the exported classes on first access (PEP 562)."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazy exports in dir()."""
+    return sorted(set(globals()) | set(__all__))
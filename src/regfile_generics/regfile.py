@@ -26,38 +26,59 @@ Generic Regfile file access through names / items operator of the regfile class
 """
 from __future__ import annotations
 
-import traceback
+import array
+import sys
 import warnings
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import ItemsView, Iterator, KeysView, ValuesView
-    from typing import Callable, Optional, Union
+    from types import FrameType
+    from typing import Any, Callable, Optional, Union
 
     from .regfile_device import RegfileDev
 
 
+# Set to False to skip the (formatting of the) truncation warnings of field values
+_DEBUG_WARN = True
+
+
 def _regfile_warn_user(msg: str) -> None:
-    """Function wrapper for warnings"""
-    fstacklevel = len(traceback.extract_stack()) + 1
-    for stacktrace in traceback.extract_stack():
-        if __file__ == stacktrace[0]:
-            break
-        fstacklevel -= 1
+    """Function wrapper for warnings - the warning is attributed to the first caller outside of this module"""
+    # stacklevel 1 is this function, 2 its caller
+    fstacklevel = 2
+    frame: Optional[FrameType] = sys._getframe(1)  # pylint: disable=protected-access
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+        fstacklevel += 1
 
     warnings.warn(msg, UserWarning, stacklevel=fstacklevel)
 
 
+def _array_typecode(n_word_bytes: int) -> str:
+    """Return the typecode of an unsigned :class:`array.array` with the given number of bytes per item"""
+    for typecode in "BHILQ":
+        if array.array(typecode).itemsize == n_word_bytes:
+            return typecode
+    raise ValueError(f"No array type available for {n_word_bytes} bytes per word.")
+
+
 class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Decompose access of a register into fields.
 
     If ``kwargs`` are specified, they are passed to the :func:`represent` function."""
 
+    # pylint: disable=protected-access
+    # the cached masks/shifts of RegisterField are accessed directly on the hot paths
+
+    # max. number of write masks the per mask caches keep (set_value accepts any mask)
+    _MASK_CACHE_MAX = 64
+
     def __init__(self, **kwargs):
         object.__setattr__(self, "_frozen", False)
 
         self.addr = 0
-        self.write_mask = -1
+        self._write_mask = -1
         self._fields = {}
         self.regfile = None
         self.name = "UNNAMED"
@@ -65,7 +86,15 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
         self.mirrored_value = 0
         self.desired_value = 0
         self._writable_fieldnames = ()
+        self._writable_fields_cache = ()
+        self._readonly_fields = frozenset()
+        self._fields_f_map = {}
+        self._decompose_tuples = ()
+        self._reset_values_cache = {}
+        self._keep_masks = {}
+        self._masked_fields = {}
         self._userattributes = ()
+        self._userattributes_snapshot = {}
         if kwargs:
             self.represent(**kwargs)
 
@@ -86,10 +115,14 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
         setattr(self, "_frozen", False)
         if addr is not None:
             self.addr = addr
+        # the caches derived from the write_mask are updated at the end
         if write_mask is not None:
-            self.write_mask = write_mask
+            self._write_mask = write_mask
         if fields is not None:
             self._fields = fields
+            for field in fields.values():
+                if not hasattr(field, "_has_setfunc"):
+                    self._add_setfunc(field)
         if regfile is not None:
             self.regfile = regfile
         if name is not None:
@@ -100,9 +133,10 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
             self.mirrored_value = mirrored_value
             self.desired_value = mirrored_value
 
-        self._userattributes = tuple(kwargs.keys())
-        for attr, value in kwargs.items():
-            setattr(self, attr, value)
+        # instance is not frozen - no need to check each attribute in __setattr__
+        self._userattributes = tuple(kwargs)
+        self._userattributes_snapshot = kwargs
+        self.__dict__.update(kwargs)
 
         self._set_writeable_fieldnames()
         self._frozen = True
@@ -113,10 +147,11 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
 
         :param key: Name of the register-field."""
 
-        if key in self._fields:
-            return self._fields[key].get_field(self._get_value())
+        field = self._fields.get(key)
+        if field is None:
+            raise KeyError(f"Field {key} does not exist. Available fields: {list(self._fields.keys())}")
 
-        raise KeyError(f"Field {key} does not exist. Available fields: {list(self._fields.keys())}")
+        return (self._get_value() & field._mask) >> field._lsb
 
     def __setitem__(self, key: str, value: int) -> None:
         """Dict-like access to write a value to a field.
@@ -124,12 +159,12 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
         :param key: name of the register field
         :param value: value to be written to the field"""
 
-        if key not in self._fields:
+        field = self._fields.get(key)
+        if field is None:
             raise KeyError(f"Field {key} does not exist. Available fields: {list(self.get_field_names())}")
 
-        field = self._fields[key]
         truncval = self._fit_fieldvalue_for_write(field, value)
-        self._set_value(truncval << field.lsb, field.get_mask())
+        self._set_value(truncval << field._lsb, field._mask)
 
     def write_update(self, *args, **kwargs):
         """Update the register.
@@ -143,21 +178,28 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
 
            submodregfile["reg0"].write_update(cfg=0b0_0100)
         """
+        field_values = kwargs
         if args:
             if len(args) == 1 and isinstance(args[0], dict):
-                for field_name, field_value in args[0].items():
-                    self.field(field_name).set(field_value)
+                field_values = {**args[0], **kwargs}
             else:
                 raise ValueError("write_update just takes one dict as argument.")
 
-        for field_name, field_value in kwargs.items():
-            self.field(field_name).set(field_value)
+        desired_value = self.desired_value
+        for field_name, field_value in field_values.items():
+            field = self._fields[field_name]
+            desired_value = (desired_value & ~field._mask) | (
+                self._fit_fieldvalue_for_write(field, field_value) << field._lsb
+            )
+        self.desired_value = desired_value
 
         self.update()
 
     def get_reg(self, value: Optional[int] = None) -> RegisterEntry:
         """Return a new RegisterEntry (shallow copy).
 
+        User attributes are taken with their current values.
+
         :param value: Value to be hold by the new RegisterEntry,
                       if value is not the value will be taken from the original instance
         """
@@ -172,7 +214,7 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
             name=self.name,
             reset=self._reset,
             mirrored_value=value,
-            **{attr: getattr(self, attr) for attr in self._userattributes},
+            **self._userattributes_snapshot,
         )
 
     def read_entry(self) -> RegisterEntry:
@@ -188,7 +230,7 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
         :param value: Integer value that should be decomposed"""
         if value is None:
             value = self._get_value()
-        return {name: field.get_field(value) for name, field in self.items()}
+        return {name: (value & mask) >> lsb for name, mask, lsb in self._decompose_tuples}
 
     def get_name(self) -> str:
         """Get the name of the register, if set otherwise return UNNAMED"""
@@ -204,26 +246,62 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
 
     def writable_field_items(self) -> Iterator[tuple[str, RegisterEntry]]:
         """Return a iterator over all writable_fields (tuple name, RegisterEntry)"""
-        for name in self._writable_fieldnames:
-            yield name, self._fields[name]
+        for name, field, _, _ in self._writable_fields_cache:
+            yield name, field
+
+    def masked_field_items(self, mask: int) -> tuple[tuple[str, RegisterField], ...]:
+        """Return the (name, field) tuples of the fields covered by mask (cached per mask)
+
+        :param mask: mask of a write operation"""
+        masked_fields = self._masked_fields.get(mask)
+        if masked_fields is None:
+            if len(self._masked_fields) >= self._MASK_CACHE_MAX:
+                self._masked_fields.clear()
+            masked_fields = self._masked_fields[mask] = tuple(
+                (name, field) for name, field in self._fields.items() if field._mask & mask
+            )
+        return masked_fields
 
     def get_reset_values(self) -> dict[str, int]:
         """Get iterator object of the tuple (fieldname, resetvalue) for writable fields only."""
-        return {name: self._fields[name].get_field(self._reset) for name in self._writable_fieldnames}
+        return dict(self._reset_values_cache)
+
+    @property
+    def write_mask(self) -> int:
+        """Mask of the writable bits of the register"""
+        return self._write_mask
+
+    @write_mask.setter
+    def write_mask(self, write_mask: int) -> None:
+        self._write_mask = write_mask
+        # the writable fields and the cached masks depend on the write_mask
+        self._set_writeable_fieldnames()
+
+    def get_keep_mask(self, mask: int) -> int:
+        """Get the writable bits that are not covered by mask (cached per mask)
+
+        :param mask: mask of a write operation"""
+        keep_mask = self._keep_masks.get(mask)
+        if keep_mask is None:
+            if len(self._keep_masks) >= self._MASK_CACHE_MAX:
+                self._keep_masks.clear()
+            keep_mask = self._keep_masks[mask] = ~mask & self._write_mask
+        return keep_mask
 
     def field(self, name: str) -> RegisterField:
-        """Get the field by name and add callback for UVM-like set() method of fields"""
-        field = self._fields[name]
-        if not hasattr(field, "_has_setfunc"):
+        """Get the field by name (the UVM-like set() method of the field is bound to this register)"""
+        return self._fields[name]
 
-            def setfunc(value: int) -> None:
-                self.desired_value &= ~field.get_mask()
-                self.desired_value |= self._fit_fieldvalue_for_write(field, value) << field.lsb
+    def _add_setfunc(self, field: RegisterField) -> None:
+        """Add callback for UVM-like set() method of the field"""
 
-            setattr(field, "set", setfunc)
-            setattr(field, "_has_setfunc", True)
+        def setfunc(value: int) -> None:
+            self.desired_value = (self.desired_value & ~field._mask) | (
+                self._fit_fieldvalue_for_write(field, value) << field._lsb
+            )
 
-        return field
+        setattr(field, "set", setfunc)
+        setattr(field, "_has_setfunc", True)
 
     def items(self) -> ItemsView[str, RegisterField]:
         """Providing all (fieldname, field) tuples for for self-inspection."""
@@ -232,22 +310,26 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
     def __iter__(self) -> Iterator[tuple[str, int]]:
         """Iterator over the (name, int) mainly for dict() conversion."""
         value = self._get_value()
-        for key, field in self._fields.items():
-            yield key, field.get_field(value)
+        return iter([(name, (value & mask) >> lsb) for name, mask, lsb in self._decompose_tuples])
 
     def __setattr__(self, name, value):
         """Enforce that no new attributes are set when the instance is frozen."""
-        if self._frozen and name not in self.__dict__:
+        attributes = self.__dict__
+        if (
+            attributes.get("_frozen", False)
+            and name not in attributes
+            and not isinstance(getattr(type(self), name, None), property)
+        ):
             raise AttributeError(f"Unable to allocate attribute {name} - Instance is frozen.")
-
-        super().__setattr__(name, value)
+        object.__setattr__(self, name, value)
+        if name in attributes.get("_userattributes", ()):
+            # copies of the entry get the user attributes from the snapshot
+            attributes["_userattributes_snapshot"] = {**attributes["_userattributes_snapshot"], name: value}
 
     def __str__(self) -> str:
         """Read the register and format it decomposed as fields as well as integer value."""
         value = self._get_value()
-        strfields = []
-        for name, field in self.items():
-            strfields.append(f"'{name}': 0x{field.get_field(value):x}")
+        strfields = [f"'{name}': 0x{(value & mask) >> lsb:x}" for name, mask, lsb in self._decompose_tuples]
         return f"Register {self.get_name()}: {{{', '.join(strfields)}}} = 0x{value:x}"
 
     def get_value(self, field_dict: Optional[dict] = None) -> int:
@@ -261,7 +343,7 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
             value = 0
             for fieldname, fieldvalue in field_dict.items():
                 field = self._fields[fieldname]
-                value |= self._fit_fieldvalue(field, fieldvalue) << field.lsb
+                value |= self._fit_fieldvalue(field, fieldvalue) << field._lsb
             return value
         raise TypeError(f"Unable to get_value for type {type(value)} -- {str(value)}.")
 
@@ -273,33 +355,57 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
         :param mask: write mask for the register
         """
         if mask is None:
-            mask = self.write_mask
-
-        if isinstance(value, int):
-            self._set_value(value, mask)
+            mask = self._write_mask
+
+        setter = self._set_value_dispatch.get(type(value))
+        if setter is not None:
+            setter(self, value, mask)
+        # subclasses of the dispatched types
+        elif isinstance(value, int):
+            self._set_value_from_int(value, mask)
         elif isinstance(value, dict):
-            writable_fieldnames = list(self.get_writable_fieldnames())
-            write_value = 0
-            for fieldname, fieldvalue in value.items():
-                if fieldname in writable_fieldnames:
-                    writable_fieldnames.remove(fieldname)
-                    field = self._fields[fieldname]
-                    write_value |= self._fit_fieldvalue_for_write(field, fieldvalue) << field.lsb
-                elif fieldname not in self.get_field_names():
-                    _regfile_warn_user(f"Ignoring non existent Field {fieldname} for write.")
-
-            if writable_fieldnames:
-                _regfile_warn_user(
-                    f"Field(s) {', '.join(writable_fieldnames)} were not explicitly "
-                    f"set during write of register {self.get_name()}!"
-                )
-
-            self._set_value(write_value, self.write_mask)
+            self._set_value_from_dict(value, mask)
         elif isinstance(value, RegisterEntry):
-            self._set_value(value.get_value(), self.write_mask)
+            self._set_value_from_entry(value, mask)
         else:
             raise TypeError(f"Unable to assign type {type(value)} -- {str(value)}.")
 
+    def _set_value_from_int(self, value: int, mask: int) -> None:
+        """:func:`set_value` for integer values"""
+        self._set_value(value, mask)
+
+    def _set_value_from_dict(self, value: dict, _mask: int) -> None:
+        """:func:`set_value` for dict values - fields that are not part of the dict are written as 0"""
+        unset_fieldnames = []
+        write_value = 0
+        # only writable fields are taken into account - no need for the read-only check
+        for fieldname, field, lsb, _ in self._writable_fields_cache:
+            if fieldname in value:
+                write_value |= self._fit_fieldvalue(field, value[fieldname]) << lsb
+            else:
+                unset_fieldnames.append(fieldname)
+
+        unknown_fieldnames = [fieldname for fieldname in value if fieldname not in self._fields]
+        if unknown_fieldnames:
+            _regfile_warn_user(f"Ignoring non existent Field {', '.join(unknown_fieldnames)} for write.")
+
+        if unset_fieldnames:
+            _regfile_warn_user(
+                f"Field(s) {', '.join(unset_fieldnames)} were not explicitly "
+                f"set during write of register {self.get_name()}!"
+            )
+
+        self._set_value(write_value, self._write_mask)
+
+    def _set_value_from_entry(self, value: RegisterEntry, _mask: int) -> None:
+        """:func:`set_value` for register entries"""
+        self._set_value(value.get_value(), self._write_mask)
+
+    _set_value_dispatch: dict[type, Callable[[RegisterEntry, Any, int], None]] = {
+        int: _set_value_from_int,
+        dict: _set_value_from_dict,
+    }
+
     def __enter__(self) -> _RepresentDict:
         """The with statement allows to add fields to the register -
 
@@ -312,6 +418,7 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
             msb = int(bits[0])
             lsb = int(bits[1]) if len(bits) == 2 else msb
             field = RegisterField(name=key, msb=msb, lsb=lsb, **kwargs)
+            self._add_setfunc(field)
             self._fields[key] = field
             if "reset" in kwargs:
                 reset = int(kwargs["reset"], 0) << lsb
@@ -336,8 +443,9 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
 
     def __getattr__(self, name: str):
         """Allow member access of fields - must have '_f' as suffix (<FIELDNAME>_f)."""
-        if name[-2:] == "_f" and name[:-2] in self._fields:
-            return self.field(name[:-2])
+        field = self._fields_f_map.get(name)
+        if field is not None:
+            return field
 
         raise AttributeError(
             f"Attribute {name} does not exist nor is a valid fieldname. "
@@ -375,7 +483,7 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
     def update(self) -> None:
         """UVM-like - Updates the content of the register in the design
         to match the desired value."""
-        self._set_value(self.desired_value, self.write_mask)
+        self._set_value(self.desired_value, self._write_mask)
 
     def write(self, *args, **kwargs) -> None:
         """UVM-like - Write the specified value in this register."""
@@ -451,30 +559,45 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
 
     def _fit_fieldvalue(self, field: RegisterField, value: int) -> int:
         """Truncate a value to fit into the field is necessary and raise a warning."""
-        mask = field.get_mask()
-        fieldmask = mask >> field.lsb
+        fieldmask = field._fieldmask
         truncval = value & fieldmask
 
-        if value != truncval:
+        if value != truncval and _DEBUG_WARN:
             _regfile_warn_user(f"{field.name}: value 0x{value:x} is truncated to 0x{truncval:x} (mask: 0x{fieldmask}).")
         return truncval
 
     def _fit_fieldvalue_for_write(self, field: RegisterField, value: int) -> int:
         """Additional to the truncation, check if field is writable."""
-        mask = field.get_mask()
-        if mask & self.write_mask != mask:
+        if field in self._readonly_fields:
             _regfile_warn_user(
                 f"Writing read-only field {field.name} (value: 0x{value:08x} -- "
-                f"mask: 0x{mask:08x} write_mask: 0x{self.write_mask:08x})."
+                f"mask: 0x{field._mask:08x} write_mask: 0x{self._write_mask:08x})."
             )
 
         return self._fit_fieldvalue(field, value)
 
     def _set_writeable_fieldnames(self) -> None:
-        """Tuple of object over all writable fieldnames"""
-        self._writable_fieldnames = tuple(
-            name for name, field in self._fields.items() if field.get_mask() & self.write_mask == field.get_mask()
-        )
+        """Tuple of object over all writable fieldnames,
+        also updates the read-only fields, the lookup of the ``_f`` attributes, the (name, mask, lsb) tuples
+        to decompose values and the reset values of the writable fields"""
+        write_mask = self._write_mask
+        writable_fields = []
+        readonly_fields = []
+        for name, field in self._fields.items():
+            mask = field._mask
+            if mask & write_mask == mask:
+                writable_fields.append((name, field, field._lsb, mask))
+            else:
+                readonly_fields.append(field)
+
+        self._writable_fields_cache = tuple(writable_fields)
+        self._readonly_fields = frozenset(readonly_fields)
+        self._writable_fieldnames = tuple(name for name, _, _, _ in writable_fields)
+        self._fields_f_map = {f"{name}_f": field for name, field in self._fields.items()}
+        self._decompose_tuples = tuple((name, field._mask, field._lsb) for name, field in self._fields.items())
+        self._reset_values_cache = {name: (self._reset & mask) >> lsb for name, _, lsb, mask in writable_fields}
+        self._keep_masks = {}
+        self._masked_fields = {}
 
     def get_register_entry(self, value: int) -> RegisterEntry:  # pragma: nocover
         """.. deprecated:: 0.2.0
@@ -492,7 +615,13 @@ class RegisterEntry:  # pylint: disable=too-many-instance-attributes,too-many-pu
 
 
 class RegfileEntry(RegisterEntry):
-    """RegfileEntry belonging to a :class:`.Regfile` which is callback on access"""
+    """RegfileEntry belonging to a :class:`.Regfile` which is callback on access
+
+    If the class attribute ``_skip_redundant_writes`` is set to ``True``, writes that would not change
+    the mirrored value are not forwarded to the regfile device. This is disabled by default, since
+    registers with side effects on write (e.g. trigger fields) need every write access."""
+
+    _skip_redundant_writes = False
 
     def _get_value(self):
         value = self.regfile._read(self)  # pylint: disable=protected-access
@@ -509,6 +638,12 @@ class RegfileEntry(RegisterEntry):
         return value
 
     def _set_value(self, value, mask):
+        if self._skip_redundant_writes:
+            new_value = (self.desired_value & ~mask) | (value & mask)
+            if new_value == self.mirrored_value:
+                self.desired_value = new_value
+                return
+
         super()._set_value(value, mask)
         self.regfile._write(self, value, mask)  # pylint: disable=protected-access
 
@@ -539,6 +674,7 @@ class Regfile:
         self.__value_mask = (1 << (8 * self._dev.n_word_bytes)) - 1
         self.__base_addr = base_addr
         self._entries: dict[str, RegfileEntry] = {}
+        self._entries_r_map: dict[str, RegfileEntry] = {}
         if name:
             self._name = name
         else:
@@ -567,22 +703,23 @@ class Regfile:
           submodregfile['reg0'] = {'cfg': 0b1_1011}
         """
 
-        if key not in self._entries:
+        entry = self._entries.get(key)
+        if entry is None:
             raise KeyError(f"Regfile has no entry named '{key}'.")
 
-        self._entries[key].write(value)
+        entry.write(value)
 
     def __getitem__(self, key: str) -> RegisterEntry:
         """Access a register entry of register.
 
         :param key: name of the register"""
 
-        if key not in self._entries:
-            if not self._frozen:
-                self._entries[key] = RegfileEntry(regfile=self, name=key)
-            else:
+        entry = self._entries.get(key)
+        if entry is None:
+            if self._frozen:
                 raise KeyError(f"Regfile has no entry named '{key}'.")
-        return self._entries[key]
+            entry = self._entries[key] = RegfileEntry(regfile=self, name=key)
+        return entry
 
     def keys(self) -> KeysView[str]:
         """Get all register names of the Regfile."""
@@ -614,12 +751,18 @@ class Regfile:
         :param dev: regfile device
         """
         self._dev = dev
+        self.__value_mask = (1 << (8 * dev.n_word_bytes)) - 1
 
     def __setattr__(self, name, value):
         """Enforce that no new attributes are set when the instance is frozen."""
-        if self._frozen and name not in self.__dict__:
+        attributes = self.__dict__
+        if (
+            attributes.get("_frozen", False)
+            and name not in attributes
+            and not isinstance(getattr(type(self), name, None), property)
+        ):
             raise AttributeError(f"Unable to allocate attribute {name} - Instance is frozen.")
-        super().__setattr__(name, value)
+        object.__setattr__(self, name, value)
 
     def __getattr__(self, name):
         """Providing additional attribute-like access of a register.
@@ -631,8 +774,9 @@ class Regfile:
 
             assert submodregfile[\"config\"] == submodregfile.config_r
         """
-        if name[-2:] == "_r" and name[:-2] in self._entries:
-            return self._entries[name[:-2]]
+        entry = self._entries_r_map.get(name)
+        if entry is not None:
+            return entry
         raise AttributeError(f"Attribute {name} does not exist")
 
     def __enter__(self):
@@ -642,11 +786,12 @@ class Regfile:
 
     def __exit__(self, exception_type, exception_value, exception_traceback):
         """Context manager of with statement - Locks the instances again."""
+        self._entries_r_map = {f"{name}_r": entry for name, entry in self._entries.items()}
         self._frozen = True
 
     def _read(self, entry):
         """Mainly used by register entry to obtain the value from the registerfile device."""
-        return self._dev.read(self.get_base_addr(), entry)
+        return self._dev.read(self.__base_addr, entry)
 
     def _write(self, entry, value, mask):
         """Mainly used by register entry to write the value to registerfile device."""
@@ -657,7 +802,7 @@ class Regfile:
                 f"the specified word size ({self._dev.n_word_bytes}), "
                 f"truncated to 0x{regvalue:x} / 0x{self.__value_mask:x}."
             )
-        self._dev.write(self.get_base_addr(), entry, value, mask)
+        self._dev.write(self.__base_addr, entry, value, mask)
 
 
 class RegfileMemAccess:
@@ -674,6 +819,7 @@ class RegfileMemAccess:
 
     def __init__(self, rfdev: RegfileDev, base_addr: int, **kwargs):
         self._dev = rfdev
+        self._word_bytes = rfdev.n_word_bytes
         self.__base_addr = base_addr
         self.__do_check_idx = False
         if kwargs["size"]:
@@ -692,7 +838,7 @@ class RegfileMemAccess:
         :param index: word address to be read"""
 
         self.__check_idx(index)
-        return self._dev.rfdev_read(self.__base_addr + self._dev.n_word_bytes * index)
+        return self._dev.rfdev_read(self.__base_addr + self._word_bytes * index)
 
     def __setitem__(self, index: int, value: int):
         """Write a memory element via index (word addressing)
@@ -701,7 +847,7 @@ class RegfileMemAccess:
         :value value: value to be written to the memory"""
 
         self.__check_idx(index)
-        self._dev.rfdev_write(self.__base_addr + self._dev.n_word_bytes * index, value, -1, -1)
+        self._dev.rfdev_write(self.__base_addr + self._word_bytes * index, value, -1, -1)
 
     def get_rfdev(self) -> RegfileDev:
         """Get the regfile device with is used upon access."""
@@ -713,6 +859,7 @@ class RegfileMemAccess:
         :param dev: regfile device"""
 
         self._dev = dev
+        self._word_bytes = dev.n_word_bytes
 
     def get_base_addr(self) -> int:
         """Return the base address of the register file (provided upon instantiation)."""
@@ -740,6 +887,26 @@ class RegfileMemAccess:
 
         return self._dev.blockread(self.__base_addr + addr, size)
 
+    def read_image_buffer(self, addr: int, size: int) -> array.array:
+        """Read Image starting on specified address into a typed buffer
+        (word size of the array is :attr:`.regfile_device.RegfileDev.n_word_bytes`).
+
+        If the regfile device provides ``blockread_into(start_addr, buffer)`` the data is read
+        directly into the buffer, otherwise the result of :func:`read_image` is converted.
+
+        :param addr: start address
+        :param size: size of image to be read from the memory
+
+        :return: memory image as array"""
+
+        typecode = _array_typecode(self._dev.n_word_bytes)
+        if hasattr(self._dev, "blockread_into"):
+            image = array.array(typecode, bytes(size * self._dev.n_word_bytes))
+            self._dev.blockread_into(self.__base_addr + addr, memoryview(image))
+            return image
+
+        return array.array(typecode, self.read_image(addr, size))
+
     def write_image(self, addr: int, image: tuple[int, ...]) -> None:
         """Write Image starting on specified address.
 
@@ -771,26 +938,31 @@ class RegisterField:
 
     Any information that should be store with the field such as the reset value, type, etc. is optional kwarg."""
 
+    # user defined informations (and the bound set() callback) are kept in __dict__
+    __slots__ = ("name", "msb", "lsb", "_mask", "_lsb", "_fieldmask", "_has_setfunc", "__dict__")
+
     def __init__(self, **kwargs):
         self.name = kwargs.pop("name")
         self.msb = kwargs.pop("msb")
         self.lsb = kwargs.pop("lsb")
 
-        for key, value in kwargs.items():
-            self.__setattr__(key, value)
+        self.__dict__.update(kwargs)
 
-        self.__mask = (1 << (self.msb + 1)) - (1 << self.lsb)
+        # cached for the access functions of the register entry
+        self._mask = (1 << (self.msb + 1)) - (1 << self.lsb)
+        self._lsb = self.lsb
+        self._fieldmask = self._mask >> self.lsb
 
     def get_field(self, value: int) -> int:
         """Get the value of the field from the register value
 
         :param value: Value of the register to extract the field value
         """
-        return (value & self.__mask) >> self.lsb
+        return (value & self._mask) >> self._lsb
 
     def get_mask(self) -> int:
         """Get the mask of the field"""
-        return self.__mask
+        return self._mask
 
     def __str__(self) -> str:
         """Return the name of the field"""
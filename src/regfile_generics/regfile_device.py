@@ -25,35 +25,98 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import random
-import struct
 import sys
 import traceback
 import warnings
+from collections.abc import MutableMapping
 from typing import TYPE_CHECKING, Callable, cast
 
 if TYPE_CHECKING:  # pragma: nocover
-    from typing import Optional
+    from collections.abc import Iterator
+    from typing import Any, Optional
+
+    import numpy
 
     from .regfile import RegfileEntry
 
 
+# page size of the memory of RegfileDevSubwordDebug
+_PAGE_SHIFT = 12
+_PAGE_SIZE = 1 << _PAGE_SHIFT
+_PAGE_MASK = _PAGE_SIZE - 1
+
+
+@functools.lru_cache(maxsize=None)
+def _make_subword_finder(n_word_bytes: int) -> Callable[[int, int], tuple[int, int]]:
+    """Generates the subword search of :class:`.RegfileDevSubword` unrolled for the given word size.
+
+    The generated function ``find_subword(mask, keep_mask)`` returns (offset, size) in bytes of the largest aligned
+    subword covering all bits of mask (inside the word) without any bit of keep_mask - (0, 0) if there is no such
+    subword.
+
+    :param n_word_bytes: number of bytes per word"""
+
+    word_mask = (1 << (8 * n_word_bytes)) - 1
+    lines = ["def find_subword(mask, keep_mask):"]
+
+    # go from full word to shorter subwords (e.g. 32, 16, 8 bits --> 4, 2, 1 bytes)
+    size = n_word_bytes
+    while size:
+        for offset in range(0, n_word_bytes, size):
+            subword_mask = ((1 << (8 * size)) - 1) << (8 * offset)
+            # all write bits are covered? && no keep bit would be overwritten?
+            lines.append(f"    if not mask & 0x{word_mask & ~subword_mask:x} and not keep_mask & 0x{subword_mask:x}:")
+            lines.append(f"        return {offset}, {size}")
+        size //= 2
+    lines.append("    return 0, 0")
+
+    namespace: dict[str, Callable[[int, int], tuple[int, int]]] = {}
+    exec(compile("\n".join(lines), f"<subword finder {n_word_bytes}>", "exec"), namespace)  # pylint: disable=exec-used
+    return namespace["find_subword"]
+
+
 class RegfileDev:
     """Regfile Device class that handels the access of a Regfile
 
-    :param callback: dict with rfdev_read/rfdev_write/blockread/blockwrite
+    :param callback: dict with rfdev_read/rfdev_write/blockread/blockwrite/batch_submit
                    pointing to a register read/write function
+                   (the read/write functions are looked up once upon init),
+                   batch_submit gets the (addr, value, mask, write_mask) tuples of a blockwrite at once
     :param bytes_per_word: bytes per word a single register access can handle (default 4)
     :param logger: logger instance
     :param prefix: prefix for (debug) logging with the logger instance
 
+    Register writes of the built-in devices (:class:`.RegfileDevSimple`, :class:`.RegfileDevSubword`)
+    go to their ``_rfdev_write_keep`` hook with the cached keep mask of the register entry,
+    unless a derived class overrides ``rfdev_write``. The hook is bound upon init -
+    methods patched on the class afterwards do not intercept the register writes of existing devices.
+
     .. deprecated:: 0.2.0
 
       :key blockread: reference to a blockread function, use callback dict instead
       :key blockwrite: reference to a blockwrite function, use callback dict instead"""
 
+    __slots__ = (
+        "_bytes_per_word",
+        "logger",
+        "_prefix",
+        "callback",
+        "_cb_read",
+        "_cb_write",
+        "_write_keep",
+    )
+
+    # allowed keys of the callback argument while class initialization
+    _ALLOWED_CALLBACKS: frozenset[str] = frozenset({"rfdev_read", "rfdev_write"})
+    # key of the write callback
+    _WRITE_CALLBACK = "rfdev_write"
+    # allowed keys of the callback argument which do not need to be implemented
+    _OPTIONAL_CALLBACKS: frozenset[str] = frozenset({"blockread", "blockwrite", "batch_submit"})
+
     def __init__(
         self,
         callback: Optional[dict[str, Callable]] = None,
@@ -68,28 +131,39 @@ class RegfileDev:
         self._prefix = prefix
         self.callback = callback if callback else {}
 
-        for blockop in ("blockread", "blockwrite"):
-            if blockop in kwargs:  # pragma: nocover
-                warnings.warn(
-                    f"RegfileDev init - kwarg {blockop} has been deprecated use the callback dict instead.",
-                    UserWarning,
-                    stacklevel=2,
-                )
-                self.callback[blockop] = kwargs[blockop]
+        if kwargs:  # pragma: nocover
+            for blockop in ("blockread", "blockwrite"):
+                if blockop in kwargs:
+                    warnings.warn(
+                        f"RegfileDev init - kwarg {blockop} has been deprecated use the callback dict instead.",
+                        UserWarning,
+                        stacklevel=2,
+                    )
+                    self.callback[blockop] = kwargs[blockop]
 
         if not isinstance(self.callback, dict):
             raise TypeError("Argument 'callback' has to dict with name, callback function.")
 
-        if not set(self.callback) <= self._allowed_callbacks():
-            raise AttributeError(f"Only {self._allowed_callbacks} are allowed as callback functions.")
+        allowed_callbacks = self._ALLOWED_CALLBACKS
+        if not allowed_callbacks.union(self._OPTIONAL_CALLBACKS).issuperset(self.callback):
+            raise AttributeError(
+                f"Only {sorted(allowed_callbacks.union(self._OPTIONAL_CALLBACKS))} are allowed as callback functions."
+            )
 
-        for func in self._allowed_callbacks() - set(self.callback):
+        for func in allowed_callbacks.difference(self.callback):
             if not hasattr(self, func):
                 raise TypeError(f"Function {func} has to be implemented or passed as callback function.")
 
-    def _allowed_callbacks(self) -> set[str]:
-        """Returns allowed keys to be passed as inside the callback argument while class initialization"""
-        return {"rfdev_read", "rfdev_write"}
+        # resolve the callbacks once for the access methods
+        self._cb_read = cast(Callable[[int], int], self.callback.get("rfdev_read"))
+        self._cb_write = cast(Callable[..., None], self.callback.get(self._WRITE_CALLBACK))
+
+        # devices implementing rfdev_write by _rfdev_write_keep get the cached keep mask of the entry upon write
+        # (unless rfdev_write is overridden by a derived class)
+        rfdev_write_cls = next(cls for cls in type(self).__mro__ if "rfdev_write" in vars(cls))
+        self._write_keep: Optional[Callable[[int, int, int, int], None]] = (
+            getattr(self, "_rfdev_write_keep") if "_rfdev_write_keep" in vars(rfdev_write_cls) else None
+        )
 
     @property
     def n_word_bytes(self) -> int:
@@ -104,7 +178,9 @@ class RegfileDev:
         if "blockread" in self.callback:
             return self.callback["blockread"](start_addr, size)
 
-        return [self.rfdev_read(start_addr + i * self.n_word_bytes) for i in range(size)]
+        rfdev_read = self.rfdev_read
+        nwb = self._bytes_per_word
+        return [rfdev_read(addr) for addr in range(start_addr, start_addr + size * nwb, nwb)]
 
     def blockwrite(self, start_addr: int, values: tuple[int, ...]) -> None:
         """Initiate a blockwrite used for memory access
@@ -115,17 +191,50 @@ class RegfileDev:
             self.callback["blockwrite"](start_addr, values)
             return
 
-        mask = (1 << (8 * self.n_word_bytes)) - 1
-        write_mask = mask
-        for i, value in enumerate(values):
-            self.rfdev_write(start_addr + i * self.n_word_bytes, value, mask, write_mask)
+        nwb = self._bytes_per_word
+        mask = (1 << (8 * nwb)) - 1
+
+        if "batch_submit" in self.callback:
+            self.callback["batch_submit"](
+                tuple(
+                    (addr, value, mask, mask)
+                    for addr, value in zip(range(start_addr, start_addr + len(values) * nwb, nwb), values)
+                )
+            )
+            return
+
+        rfdev_write = self.rfdev_write
+        addr = start_addr
+        for value in values:
+            rfdev_write(addr, value, mask, mask)
+            addr += nwb
+
+    def blockread_np(self, start_addr: int, size: int) -> numpy.ndarray:
+        """Blockread returning an unsigned numpy array of :attr:`n_word_bytes` sized words
+        - could be overridden for devices with direct buffer access (e.g. a mmap'd region)
+        (requires numpy)
+
+        :param start_addr: start address of read data
+        :param size: number of words to be read"""
+        import numpy as np  # pylint: disable=import-outside-toplevel,import-error
+
+        return np.fromiter(self.blockread(start_addr, size), dtype=f"u{self._bytes_per_word}", count=size)
+
+    def blockwrite_np(self, start_addr: int, values: numpy.ndarray) -> None:
+        """Blockwrite of an unsigned numpy array of :attr:`n_word_bytes` sized words
+        - could be overridden for devices with direct buffer access (e.g. a mmap'd region)
+
+        :param start_addr: start address of write data
+        :param values: word array to be written"""
+        self.blockwrite(start_addr, tuple(values.tolist()))
 
     def rfdev_read(self, addr: int) -> int:
         """Read method calling `rfdev_read` of callback dict passed upon init
         - could be overridden, when deriving a new RegfileDev"""
-        value = self.callback["rfdev_read"](addr)
-        if self.logger:
-            self.logger.debug(
+        value = self._cb_read(addr)
+        logger = self.logger
+        if logger is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 "RegfileDevice: Read address 0x%x -- value: 0x%x",
                 addr,
                 value,
@@ -139,8 +248,9 @@ class RegfileDev:
         :param entry: A register entry
         """
         value = self.rfdev_read(baseaddr + entry.addr)
-        if self.logger and self.logger.isEnabledFor(logging.INFO):
-            self.logger.info(
+        logger = self.logger
+        if logger is not None and logger.isEnabledFor(logging.INFO):
+            logger.info(
                 "%sReading %s: %s",
                 self._prefix,
                 entry.regfile.name,
@@ -160,15 +270,16 @@ class RegfileDev:
           (e.g. to determine if read-modify-write is necessary)
         """
 
-        if self.logger:
-            self.logger.debug(
+        logger = self.logger
+        if logger is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 "RegfileDevice: Read address 0x%x -- value: 0x%x (mask: 0x%x, write_mask: 0x%x)",
                 addr,
                 value,
                 mask,
                 write_mask,
             )
-        self.callback["rfdev_write"](addr, value, mask, write_mask)
+        self._cb_write(addr, value, mask, write_mask)
 
     def write(self, baseaddr: int, entry: RegfileEntry, value: int, mask: int) -> None:
         """Read a register entry relative to a base address
@@ -180,11 +291,12 @@ class RegfileDev:
         """
         addr = baseaddr + entry.addr
 
-        if self.logger and self.logger.isEnabledFor(logging.INFO):
+        logger = self.logger
+        if logger is not None and logger.isEnabledFor(logging.INFO):
             update_fields = [
-                f"'{name}': 0x{field.get_field(value):x}" for name, field in entry.items() if field.get_mask() & mask
+                f"'{name}': 0x{field.get_field(value):x}" for name, field in entry.masked_field_items(mask)
             ]
-            self.logger.info(
+            logger.info(
                 "%sWriting %s: Register %s = 0x%x & 0x%x --> {%s}",
                 self._prefix,
                 entry.regfile.name,
@@ -193,7 +305,12 @@ class RegfileDev:
                 mask,
                 ", ".join(update_fields),
             )
-        self.rfdev_write(addr, value, mask, entry.write_mask)
+
+        write_keep = self._write_keep
+        if write_keep is not None:
+            write_keep(addr, value, mask, entry.get_keep_mask(mask))
+        else:
+            self.rfdev_write(addr, value, mask, entry.write_mask)
 
     def readwrite_block(self, start_addr, values, write):  # pragma: nocover
         """.. deprecated:: 0.2.0
@@ -225,8 +342,10 @@ class RegfileDevSimple(RegfileDev):
         :key rfdev_write_simple: write function which has the same signature like :func:`rfdev_write_simple`
     """
 
-    def _allowed_callbacks(self) -> set[str]:
-        return {"rfdev_read", "rfdev_write_simple"}
+    __slots__ = ()
+
+    _ALLOWED_CALLBACKS: frozenset[str] = frozenset({"rfdev_read", "rfdev_write_simple"})
+    _WRITE_CALLBACK = "rfdev_write_simple"
 
     def rfdev_write_simple(self, addr: int, value: int) -> None:
         """Simple write operation - calls back `rfdev_write_simple` if passed to constructor.
@@ -235,13 +354,14 @@ class RegfileDevSimple(RegfileDev):
         :param value: value to write
         """
 
-        if self.logger:
-            self.logger.debug(
+        logger = self.logger
+        if logger is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 "RegfileDevice: Read address 0x%x -- value: 0x%x",
                 addr,
                 value,
             )
-        self.callback["rfdev_write_simple"](addr, value)
+        self._cb_write(addr, value)
 
     def rfdev_write(self, addr: int, value: int, mask: int, write_mask: int) -> None:
         """:class:`.RegfileDev` rfdev_write implementations
@@ -252,9 +372,12 @@ class RegfileDevSimple(RegfileDev):
         :param mask: mask for the write operation to the register
         :param write_mask: mask of writeable bits inside the register"""
 
-        keep_mask = ~mask & write_mask
+        # full register writes need no keep mask
+        self._rfdev_write_keep(addr, value, mask, 0 if mask == write_mask else ~mask & write_mask)
 
-        if keep_mask == 0:
+    def _rfdev_write_keep(self, addr: int, value: int, mask: int, keep_mask: int) -> None:
+        """:func:`rfdev_write` with the writable bits not covered by mask (keep_mask) instead of the write_mask"""
+        if not keep_mask:
             self.rfdev_write_simple(addr, value)
         else:
             # read, modify, write
@@ -299,6 +422,8 @@ class RegfileDevSimpleDebug(RegfileDevSimple):
     :param interactive: if set to ``True`` the regfile device will request a user input upon read.
     """
 
+    __slots__ = ("mem", "write_count", "read_count", "__interactive")
+
     def __init__(self, interactive: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.mem: dict[int, int] = {}
@@ -321,8 +446,9 @@ class RegfileDevSimpleDebug(RegfileDevSimple):
 
         self.read_count += 1
 
-        if self.logger:
-            self.logger.debug(
+        logger = self.logger
+        if logger is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 "RegfileDevice: Read address 0x%x -- value: 0x%x",
                 addr,
                 value,
@@ -345,8 +471,9 @@ class RegfileDevSimpleDebug(RegfileDevSimple):
         :param addr: address to be read"""
         if addr not in self.mem:
             value = random.getrandbits(8 * self.n_word_bytes)
-            if self.logger:
-                self.logger.info("Generating random regfile value 0x%x", value)
+            logger = self.logger
+            if logger is not None and logger.isEnabledFor(logging.INFO):
+                logger.info("Generating random regfile value 0x%x", value)
             return value
 
         return self.mem[addr]
@@ -363,53 +490,56 @@ class RegfileDevSubword(RegfileDev):
         :key rfdev_write_simple: write function which has the same signature like :func:`rfdev_write_simple`
     """
 
+    __slots__ = ()
+
+    _ALLOWED_CALLBACKS: frozenset[str] = frozenset({"rfdev_read", "rfdev_write_subword"})
+    _WRITE_CALLBACK = "rfdev_write_subword"
+
     def rfdev_write(self, addr: int, value: int, mask: int, write_mask: int) -> None:
         # register bits that must not be changed
-        keep_mask = ~mask & write_mask
-
-        # initial subword mask: full word size - all bits to 1
-        subword_mask = (1 << (8 * self.n_word_bytes)) - 1
-
-        # go from full word to shorter subwords (e.g. 32, 16, 8 bits --> 4, 2, 1 bytes)
-        n_subword_bytes = self.n_word_bytes
-        while n_subword_bytes:
-            # iterate subwords of current size (e.g. 32bits: 0; 16bits: 0, 1; 8bits: 0, 1, 2, 3)
-            for i in range(self.n_word_bytes // n_subword_bytes):
-                # shift wordmask to current position
-                i_word_mask = subword_mask << (i * n_subword_bytes * 8)
-
-                # no keep bit would be overwritten? && all write bits are covered?
-                if ((keep_mask & i_word_mask) == 0) and ((mask & (~i_word_mask)) == 0):
-                    subword_offset = i * n_subword_bytes
-
-                    # call virtual method
-                    if self.logger:
-                        self.logger.debug(
-                            "RegfileDevice: Subwrite address 0x%x -- {value: 0x%x, n_subword_bytes: 0x%x}",
-                            addr + subword_offset,
-                            value,
-                            n_subword_bytes,
-                        )
-                    self.rfdev_write_subword(addr + subword_offset, value, n_subword_bytes)
-                    # we are done here ...
-                    return
-
-            # reduce subword bytes - next half
-            n_subword_bytes //= 2
-            # reduce subword mask - throw away the other half
-            subword_mask >>= n_subword_bytes * 8
-
-        # no success?  - full read-modify-write
+        self._rfdev_write_keep(addr, value, mask, ~mask & write_mask)
+
+    def _rfdev_write_keep(self, addr: int, value: int, mask: int, keep_mask: int) -> None:
+        """:func:`rfdev_write` with the writable bits not covered by mask (keep_mask) instead of the write_mask"""
+        n_word_bytes = self.n_word_bytes
+        subword_offset, n_subword_bytes = 0, 0
+
+        if not keep_mask:
+            # nothing to keep - the full word can be written
+            n_subword_bytes = n_word_bytes
+        elif mask and not mask >> (8 * n_word_bytes):
+            # subword search specialized for the word size (not kept on the instance - it is not picklable)
+            subword_offset, n_subword_bytes = _make_subword_finder(n_word_bytes)(mask, keep_mask)
+
+        if n_subword_bytes:
+            # call virtual method
+            logger = self.logger
+            if logger is not None and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "RegfileDevice: Subwrite address 0x%x -- {value: 0x%x, n_subword_bytes: 0x%x}",
+                    addr + subword_offset,
+                    value,
+                    n_subword_bytes,
+                )
+            self.rfdev_write_subword(addr + subword_offset, value, n_subword_bytes)
+            return
+
+        # no success?  - read-modify-write
         rmw_value = self.rfdev_read(addr)
 
         rmw_value &= ~mask
         rmw_value |= value & mask
 
-        # call virtual method
-        self.rfdev_write_subword(addr, rmw_value, self.n_word_bytes)
+        # the bits to keep hold their read value now - the smallest aligned subword covering mask is sufficient
+        subword_offset, n_subword_bytes = 0, n_word_bytes
+        if mask and not mask >> (8 * n_word_bytes):
+            first_byte = ((mask & -mask).bit_length() - 1) >> 3
+            last_byte = (mask.bit_length() - 1) >> 3
+            n_subword_bytes = 1 << (first_byte ^ last_byte).bit_length()
+            subword_offset = first_byte & -n_subword_bytes
 
-    def _allowed_callbacks(self) -> set[str]:
-        return {"rfdev_read", "rfdev_write_subword"}
+        # call virtual method
+        self.rfdev_write_subword(addr + subword_offset, rmw_value, n_subword_bytes)
 
     def rfdev_write_subword(self, addr: int, value: int, size: int) -> None:
         """Word size write operation - calls back `rfdev_write_subword` if passed to constructor.
@@ -418,39 +548,121 @@ class RegfileDevSubword(RegfileDev):
         :param value: value to write
         :param size: number of bytes to write
         """
-        self.callback["rfdev_write_subword"](addr, value, size)
+        self._cb_write(addr, value, size)
+
+
+class _PagedMemoryView(MutableMapping[int, int]):
+    """Byte-wise (address, value) view of the initialized bytes of a :class:`.RegfileDevSubwordDebug`
+
+    :param pages: pages of the device
+    :param addrs: addresses of the bytes initialized so far
+    :param page: function returning the page with the given index (allocating it if necessary)
+    """
+
+    __slots__ = ("_pages", "_addrs", "_page")
+
+    def __init__(self, pages: dict[int, bytearray], addrs: set[int], page: Callable[[int], bytearray]):
+        self._pages = pages
+        self._addrs = addrs
+        self._page = page
+
+    def __getitem__(self, addr: int) -> int:
+        if addr not in self._addrs:
+            raise KeyError(addr)
+        return self._pages[addr >> _PAGE_SHIFT][addr & _PAGE_MASK]
+
+    def __setitem__(self, addr: int, value: int) -> None:
+        self._page(addr >> _PAGE_SHIFT)[addr & _PAGE_MASK] = value
+        self._addrs.add(addr)
+
+    def __delitem__(self, addr: int) -> None:
+        if addr not in self._addrs:
+            raise KeyError(addr)
+        self._addrs.discard(addr)
+        # the byte is uninitialized again
+        self._pages[addr >> _PAGE_SHIFT][addr & _PAGE_MASK] = random.getrandbits(8)
+
+    def clear(self) -> None:
+        self._pages.clear()
+        self._addrs.clear()
+
+    def __contains__(self, addr: object) -> bool:
+        return addr in self._addrs
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._addrs)
+
+    def __len__(self) -> int:
+        return len(self._addrs)
 
 
 class RegfileDevSubwordDebug(RegfileDevSubword):
     """Debug implementation of :class:`.RegfileDevSimple`
 
+    The memory is stored in pages of random initialized bytes, :attr:`mem` provides
+    a byte-wise view (address -> byte value) of the bytes read or written so far
+    (use ``mem.clear()`` to reset the memory).
+
     :param interactive: if set to ``True`` the regfile device will request a user input upon read.
     """
 
+    __slots__ = ("__interactive", "_pages", "_addrs", "_mem", "write_count", "read_count")
+
     def __init__(self, interactive: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.__interactive = interactive
-        self.mem: dict[int, int] = {}
+        self._pages: dict[int, bytearray] = {}
+        self._addrs: set[int] = set()
+        self._mem = _PagedMemoryView(self._pages, self._addrs, self._page)
         self.write_count = 0
         self.read_count = 0
 
+    @property
+    def mem(self) -> MutableMapping[int, int]:
+        """Byte-wise (address -> byte value) view of the memory (read-only attribute)"""
+        return self._mem
+
+    def _page(self, pageidx: int) -> bytearray:
+        """Return the page with the given index, generate a random page if necessary"""
+        page = self._pages.get(pageidx)
+        if page is None:
+            page = self._pages[pageidx] = bytearray(random.randbytes(_PAGE_SIZE))
+            logger = self.logger
+            if logger is not None and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Generating random regfile values for 0x%x-0x%x.",
+                    pageidx << _PAGE_SHIFT,
+                    ((pageidx + 1) << _PAGE_SHIFT) - 1,
+                )
+        return page
+
+    def _read_bytes(self, addr: int, size: int) -> bytearray:
+        """Read size bytes starting at addr from the pages"""
+        offset = addr & _PAGE_MASK
+        if offset + size <= _PAGE_SIZE:
+            self._addrs.update(range(addr, addr + size))
+            return self._page(addr >> _PAGE_SHIFT)[offset : offset + size]
+        n_page_bytes = _PAGE_SIZE - offset
+        return self._read_bytes(addr, n_page_bytes) + self._read_bytes(addr + n_page_bytes, size - n_page_bytes)
+
+    def _write_bytes(self, addr: int, data: bytes) -> None:
+        """Write data starting at addr to the pages"""
+        offset = addr & _PAGE_MASK
+        if offset + len(data) <= _PAGE_SIZE:
+            self._addrs.update(range(addr, addr + len(data)))
+            self._page(addr >> _PAGE_SHIFT)[offset : offset + len(data)] = data
+            return
+        n_page_bytes = _PAGE_SIZE - offset
+        self._write_bytes(addr, data[:n_page_bytes])
+        self._write_bytes(addr + n_page_bytes, data[n_page_bytes:])
+
     def getvalue(self, addr: int) -> int:
         """Return memory value
 
         :param addr: address were the data will be read
         """
 
-        word = []
-        for i in range(self.n_word_bytes):
-            if (addr + i) not in self.mem:
-                byte_value = random.getrandbits(8)
-                print(f"Generating random regfile value {byte_value}.")
-                self.mem[addr + i] = byte_value
-
-            byte_value = self.mem[addr + i]
-            word.append(byte_value)
-
-        return int.from_bytes(struct.pack(f"{self.n_word_bytes}B", *word), "little")
+        return int.from_bytes(self._read_bytes(addr, self._bytes_per_word), "little")
 
     def rfdev_read(self, addr: int) -> int:
         """Debug read function interactive if necessary
@@ -465,13 +677,13 @@ class RegfileDevSubwordDebug(RegfileDevSubword):
             value,
             f"{self._prefix}REGFILE-READING from addr 0x{addr:x}",
         )
-        for i in range(self.n_word_bytes):
-            self.mem[addr + i] = (value >> (8 * i)) & 0xFF
+        self._write_bytes(addr, value.to_bytes(self._bytes_per_word, "little"))
 
         self.read_count += 1
 
-        if self.logger:
-            self.logger.debug(
+        logger = self.logger
+        if logger is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 "RegfileDevice: Read address 0x%x -- value: 0x%x",
                 addr,
                 value,
@@ -481,13 +693,50 @@ class RegfileDevSubwordDebug(RegfileDevSubword):
     def rfdev_write_subword(self, addr: int, value: int, size: int) -> None:
         print(f"{self._prefix}REGFILE-WRITING to addr 0x{addr:x} value 0x{value:x} size=0x{size:x}")
 
-        byte_values = value.to_bytes(self.n_word_bytes, "little")
-        for i in range(size):
-            self.mem[addr + i] = byte_values[i + addr & 0b11]
+        # byte lanes of the word starting at the (unaligned) address
+        byte_values = value.to_bytes(self._bytes_per_word, "little")
+        offset = addr & (self._bytes_per_word - 1)
+        self._write_bytes(addr, (byte_values[offset:] + byte_values[:offset])[:size])
         self.write_count += 1
 
 
-class StringCmdRegfileDevSimple(RegfileDevSimple):
+class _StringCmdBlockAccess(RegfileDev):
+    """Block operations of the StringCmd devices - if ``batch_execute`` is given, a block is passed
+    to it as one newline separated command string (a block read has to return one value per line),
+    otherwise the block is accessed word by word via ``execute``.
+
+    The attributes are held in the slots of the derived devices."""
+
+    __slots__ = ()
+
+    execute: Callable[[str], str]
+    batch_execute: Optional[Callable[[str], Any]]
+    _read_fmt: str
+    # command template of a full word write with address and value
+    _write_fmt: str
+
+    def blockread(self, start_addr: int, size: int) -> list[int]:
+        batch_execute = self.batch_execute
+        if batch_execute is None or "blockread" in self.callback:
+            return super().blockread(start_addr, size)
+
+        nwb = self.n_word_bytes
+        read_fmt = self._read_fmt
+        result = batch_execute("\n".join(read_fmt % addr for addr in range(start_addr, start_addr + size * nwb, nwb)))
+        return [int(value, 0) for value in result.split()]
+
+    def blockwrite(self, start_addr: int, values: tuple[int, ...]) -> None:
+        batch_execute = self.batch_execute
+        if batch_execute is None or "blockwrite" in self.callback or "batch_submit" in self.callback:
+            super().blockwrite(start_addr, values)
+            return
+
+        nwb = self.n_word_bytes
+        write_fmt = self._write_fmt
+        batch_execute("\n".join(write_fmt % (start_addr + i * nwb, value) for i, value in enumerate(values)))
+
+
+class StringCmdRegfileDevSimple(_StringCmdBlockAccess, RegfileDevSimple):
     """Forwards regfile operations to a function call with string command,
     to do the regfile operations.
 
@@ -498,18 +747,31 @@ class StringCmdRegfileDevSimple(RegfileDevSimple):
      Write:
          w<NUMBITS> <address> <value>
              e.g. w32 0x80 0xF9852A
+
+    If ``batch_execute`` is given, block operations pass one command per line in a single call to it,
+    a block read expects one value per line in return.
     """
 
-    def __init__(self, execute: Optional[Callable[[str], Optional[str]]] = None, **kwargs):
+    __slots__ = ("execute", "batch_execute", "_read_fmt", "_write_fmt")
+
+    def __init__(
+        self,
+        execute: Optional[Callable[[str], Optional[str]]] = None,
+        batch_execute: Optional[Callable[[str], Optional[str]]] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
-        self.execute = execute
+        self.execute = cast(Callable[[str], str], execute)
+        self.batch_execute = batch_execute
+        self._read_fmt = f"r{8*self.n_word_bytes} 0x%x"
+        self._write_fmt = f"w{8*self.n_word_bytes} 0x%x 0x%x"
 
     def rfdev_read(self, addr: int) -> int:
         """Debug read function implementation translates to :func:`execute()`
 
         :param addr: absolute address for read operation"""
 
-        return int(cast(Callable[[str], str], self.execute)(f"r{8*self.n_word_bytes} 0x{addr:x}"), 0)
+        return int(self.execute(self._read_fmt % addr), 0)
 
     def rfdev_write_simple(self, addr: int, value: int):
         """Debug write function implementation translates to :func:`execute()`
@@ -517,10 +779,10 @@ class StringCmdRegfileDevSimple(RegfileDevSimple):
         :param addr: absolute address for write operation
         :param value: value to write"""
 
-        cast(Callable[[str], None], self.execute)(f"w{8*self.n_word_bytes} 0x{addr:x} 0x{value:x}")
+        self.execute(self._write_fmt % (addr, value))
 
 
-class StringCmdRegfileDevSubword(RegfileDevSubword):
+class StringCmdRegfileDevSubword(_StringCmdBlockAccess, RegfileDevSubword):
     """Forwards regfile operations to a function call with string command,
     to do the regfile operations.
 
@@ -532,18 +794,53 @@ class StringCmdRegfileDevSubword(RegfileDevSubword):
          w<NUMBITS> <address> <value> [bsel]
              e.g. w32 0x80 0xF9852A
                   w32 0x80 0xF9852A 0x1
+
+    If ``batch_execute`` is given, block operations pass one command per line in a single call to it,
+    a block read expects one value per line in return.
     """
 
-    def __init__(self, **kwargs):
+    __slots__ = (
+        "execute",
+        "batch_execute",
+        "_read_fmt",
+        "_write_fmt",
+        "_subword_addrmask",
+        "_write_cmd_fmts",
+    )
+
+    # max. number of (address, size) write command templates kept
+    _WRITE_CMD_FMTS_MAX = 1024
+
+    def __init__(
+        self,
+        execute: Optional[Callable[[str], Optional[str]]] = None,
+        batch_execute: Optional[Callable[[str], Optional[str]]] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
-        self.execute = kwargs["execute"]
+        self.execute = cast(Callable[[str], str], execute)
+        self.batch_execute = batch_execute
+
+        n_word_bytes = self.n_word_bytes
+        self._read_fmt = f"r{8*n_word_bytes} 0x%x"
+        self._subword_addrmask = n_word_bytes - 1
+        self._write_fmt = f"w{8*n_word_bytes} 0x%x 0x%x 0x{(1 << n_word_bytes) - 1:x}"
+        # write command templates with address and bsel filled in for (addr, size)
+        self._write_cmd_fmts: dict[tuple[int, int], str] = {}
 
     def rfdev_read(self, addr: int) -> int:
-        return int(self.execute(f"r{8*self.n_word_bytes} 0x{addr:x}"), 0)
+        return int(self.execute(self._read_fmt % addr), 0)
 
     def rfdev_write_subword(self, addr: int, value: int, size: int) -> None:
-        subword_addrbits = self.n_word_bytes.bit_length() - 1
-        bsel = ((1 << size) - 1) << (addr & subword_addrbits)
-        addr_aligned = addr & ~subword_addrbits
+        write_cmd_fmt = self._write_cmd_fmts.get((addr, size))
+        if write_cmd_fmt is None:
+            if len(self._write_cmd_fmts) >= self._WRITE_CMD_FMTS_MAX:
+                self._write_cmd_fmts.clear()
+
+            subword_offset = addr & self._subword_addrmask
+            bsel = ((1 << size) - 1) << subword_offset
+            write_cmd_fmt = self._write_cmd_fmts[(addr, size)] = (
+                f"w{8*self.n_word_bytes} 0x{addr - subword_offset:x} 0x%x 0x{bsel:x}"
+            )
 
-        self.execute(f"w{8*self.n_word_bytes} 0x{addr_aligned:x} 0x{value:x} 0x{bsel:x}")
+        self.execute(write_cmd_fmt % value)
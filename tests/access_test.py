@@ -1,8 +1,25 @@
 """Regfile access tests"""
 
-from pytest import warns
-
-from .fixtures import FixtureMemAccess, FixtureSimpleRegfile, FixtureSubwordRegfile
+import logging
+import pickle
+import random
+import warnings
+
+from pytest import LogCaptureFixture, MonkeyPatch, importorskip, raises, warns
+
+from regfile_generics import regfile as regfile_module
+from regfile_generics import (
+    RegfileDevSimple,
+    RegfileDevSimpleDebug,
+    RegfileDevSubword,
+    RegfileDevSubwordDebug,
+    RegfileMemAccess,
+    RegisterEntry,
+    StringCmdRegfileDevSimple,
+    StringCmdRegfileDevSubword,
+)
+
+from .fixtures import FixtureMemAccess, FixtureSimpleRegfile, FixtureSubwordRegfile, SubmodRegfile
 
 # pylint: disable=line-too-long,missing-function-docstring
 
@@ -65,6 +82,9 @@ def test_truncation_warning(sessionsubwordregfile: FixtureSubwordRegfile) -> Non
 
     assert rfdev.getvalue(0xF000_0008) == 0x100
 
+    with warns(UserWarning, match=r"^Ignoring non existent Field NOT_EXISTENT0, NOT_EXISTENT1 for write.$"):
+        regfile["reg1_high"] = {"NOT_EXISTENT0": 0x0FF, "NOT_EXISTENT1": 0x0FF, "cfg_trigger": 0x1}
+
     with warns(
         UserWarning,
         match=r"^Writing read-only field status \(value: 0x00000100 -- mask: 0xffff0000 write_mask: 0x0000001f\).$",
@@ -72,6 +92,18 @@ def test_truncation_warning(sessionsubwordregfile: FixtureSubwordRegfile) -> Non
         regfile["reg0"]["status"] = 0x100
 
 
+def test_truncation_warning_disabled(monkeypatch: MonkeyPatch) -> None:
+    rfdev = RegfileDevSubwordDebug()
+    regfile = SubmodRegfile(rfdev, 0xF000_0000)
+
+    monkeypatch.setattr(regfile_module, "_DEBUG_WARN", False)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        regfile["reg0"]["cfg"] = 0x3F
+    assert regfile["reg0"]["cfg"] == 0x1F
+    assert rfdev.getvalue(0xF000_0000) & 0x1F == 0x1F
+
+
 def test_read_entry(sessionsubwordregfile: FixtureSubwordRegfile) -> None:
     regfile, rfdev = sessionsubwordregfile
     write_count = rfdev.write_count
@@ -144,6 +176,29 @@ def test_writable_fields(sessionsubwordregfile: FixtureSubwordRegfile):
     assert not reg_addr40_fields
 
 
+def test_write_mask_update() -> None:
+    regfile = SubmodRegfile(RegfileDevSubwordDebug(), 0xF000_0000)
+    reg = regfile["reg0"]
+    assert reg.get_writable_fieldnames() == ("cfg",)
+
+    reg.write_mask = 0xFFFF_001F
+    assert reg.get_writable_fieldnames() == ("cfg", "status")
+    assert dict(reg.writable_field_items()) == {"cfg": reg.field("cfg"), "status": reg.field("status")}
+    assert "status" in reg.get_reset_values()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        reg["status"] = 0x100
+
+    # the write_mask of a copy does not change the fields of the original register
+    copy = reg.get_reg()
+    copy.write_mask = 0x0000_001F
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        reg["status"] = 0x200
+    with warns(UserWarning, match=r"^Writing read-only field status"):
+        copy["status"] = 0x100
+
+
 def test_rfdev_simple(sessionsimpleregfile: FixtureSimpleRegfile) -> None:
     regfile, rfdev = sessionsimpleregfile
 
@@ -181,3 +236,265 @@ def test_mem(sessionmemregfile: FixtureMemAccess) -> None:
     image = regfile.read_image(0xC, 15)
     for i in range(15):
         assert image[i] == i + 1
+
+
+def test_debug_mem_mapping(monkeypatch: MonkeyPatch) -> None:
+    rfdev = RegfileDevSubwordDebug()
+    assert len(rfdev.mem) == 0
+    assert 0x100 not in rfdev.mem
+
+    rfdev.rfdev_write_subword(0x101, 0xAB00, 1)
+    assert dict(rfdev.mem) == {0x101: 0xAB}
+    assert 0x100 not in rfdev.mem and 0x102 not in rfdev.mem
+
+    rfdev.getvalue(0x100)
+    assert sorted(rfdev.mem) == [0x100, 0x101, 0x102, 0x103]
+
+    # setting an untouched byte allocates its page
+    rfdev.mem[0x5000] = 0x12
+    assert rfdev.mem[0x5000] == 0x12
+    assert rfdev.getvalue(0x5000) & 0xFF == 0x12
+    assert len(rfdev.mem) == 8
+
+    del rfdev.mem[0x101]
+    assert 0x101 not in rfdev.mem
+    assert rfdev.mem.pop(0x100) is not None
+    rfdev.mem.update({0x100: 0x1, 0x101: 0x2})
+    assert rfdev.mem[0x101] == 0x2
+
+    # reset of the memory - new pages are zero initialized for the check
+    rfdev.rfdev_write_subword(0x0, 0x11223344, 4)
+    rfdev.mem.clear()
+    assert len(rfdev.mem) == 0
+    monkeypatch.setattr(random, "randbytes", bytes)
+    assert rfdev.getvalue(0x0) == 0
+    with raises(AttributeError):
+        rfdev.mem = {}  # type: ignore[misc]
+
+
+def test_mem_buffer(sessionmemregfile: FixtureMemAccess) -> None:
+    regfile, rfdev = sessionmemregfile
+
+    regfile.write_image(0x100, tuple(0x100 + i for i in range(8)))
+
+    image = regfile.read_image_buffer(0x100, 8)
+    assert image.itemsize == rfdev.n_word_bytes
+    assert image.tolist() == [0x100 + i for i in range(8)]
+
+
+def test_mem_buffer_blockread_into() -> None:
+    class BufferRegfileDev(RegfileDevSimpleDebug):
+        __slots__ = ("blockread_into_count",)
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.blockread_into_count = 0
+
+        def blockread_into(self, start_addr: int, buffer: memoryview) -> None:
+            self.blockread_into_count += 1
+            nwb = self.n_word_bytes
+            for i in range(len(buffer)):
+                buffer[i] = self.mem[start_addr + i * nwb]
+
+    rfdev = BufferRegfileDev()
+    regfile = RegfileMemAccess(rfdev, 0xA000_0000, size=1024)
+    regfile.write_image(0x100, tuple(0x100 + i for i in range(8)))
+
+    read_count = rfdev.read_count
+    image = regfile.read_image_buffer(0x100, 8)
+    assert image.tolist() == [0x100 + i for i in range(8)]
+    assert rfdev.blockread_into_count == 1
+    assert rfdev.read_count == read_count
+
+
+def test_mem_numpy(sessionmemregfile: FixtureMemAccess) -> None:
+    np = importorskip("numpy")
+    regfile, rfdev = sessionmemregfile
+
+    rfdev.blockwrite_np(regfile.get_base_addr() + 0x200, np.arange(0x200, 0x208, dtype=np.uint32))
+
+    image = rfdev.blockread_np(regfile.get_base_addr() + 0x200, 8)
+    assert image.itemsize == rfdev.n_word_bytes
+    assert image.tolist() == [0x200 + i for i in range(8)]
+
+
+def test_stringcmd_block_access() -> None:
+    for dev_class in (StringCmdRegfileDevSimple, StringCmdRegfileDevSubword):
+        mem: dict[int, int] = {}
+        calls: list[str] = []
+
+        def execute(cmd: str, mem=mem, calls=calls) -> str:
+            calls.append(cmd)
+            results = []
+            for line in cmd.splitlines():
+                op, addr, *args = line.split()
+                if op.startswith("r"):
+                    results.append(f"0x{mem.get(int(addr, 0), 0):x}")
+                else:
+                    mem[int(addr, 0)] = int(args[0], 0)
+            return "\n".join(results)
+
+        regfile = RegfileMemAccess(dev_class(execute=execute, batch_execute=execute), 0x1000, size=64)
+        regfile.write_image(0x10, tuple(range(4)))
+        assert len(calls) == 1
+        assert len(calls[0].splitlines()) == 4
+        assert regfile.read_image(0x10, 4) == list(range(4))
+        assert len(calls) == 2
+
+        # without batch_execute one command per word
+        calls.clear()
+        regfile = RegfileMemAccess(dev_class(execute=execute), 0x1000, size=64)
+        regfile.write_image(0x20, tuple(range(4)))
+        assert regfile.read_image(0x20, 4) == list(range(4))
+        assert len(calls) == 8
+        assert all(len(cmd.splitlines()) == 1 for cmd in calls)
+
+
+def test_stringcmd_subword_bsel() -> None:
+    calls: list[str] = []
+    rfdev = StringCmdRegfileDevSubword(execute=calls.append)
+
+    rfdev.rfdev_write_subword(0x101, 0xAB00, 1)
+    rfdev.rfdev_write_subword(0x102, 0xCDEF0000, 2)
+    rfdev.rfdev_write_subword(0x100, 0x12345678, 4)
+    rfdev.rfdev_write_subword(0x101, 0xCD00, 1)
+    rfdev.rfdev_write_subword(0x0, 0x0, 4)
+    # unaligned subword
+    rfdev.rfdev_write_subword(0x101, 0xABCD00, 2)
+    assert calls == [
+        "w32 0x100 0xab00 0x2",
+        "w32 0x100 0xcdef0000 0xc",
+        "w32 0x100 0x12345678 0xf",
+        "w32 0x100 0xcd00 0x2",
+        "w32 0x0 0x0 0xf",
+        "w32 0x100 0xabcd00 0x6",
+    ]
+
+
+def test_subword_rmw() -> None:
+    calls: list[str] = []
+
+    def execute(cmd: str) -> str:
+        calls.append(cmd)
+        return "0xa0b0c0d0"
+
+    rfdev = StringCmdRegfileDevSubword(execute=execute)
+
+    # lower nibble of byte 1 - upper nibble has to be kept
+    rfdev.rfdev_write(0x100, 0x0500, 0x0F00, 0xFFFF)
+    assert calls == ["r32 0x100", "w32 0x100 0xa0b0c5d0 0x2"]
+
+
+def test_callback_access() -> None:
+    mem: dict[int, int] = {}
+    writes: list[tuple[int, ...]] = []
+
+    def write_simple(addr: int, value: int) -> None:
+        writes.append((addr, value))
+        mem[addr] = value
+
+    def write_subword(addr: int, value: int, size: int) -> None:
+        writes.append((addr, value, size))
+        mem[addr] = value
+
+    for rfdev in (
+        RegfileDevSimple(callback={"rfdev_read": mem.__getitem__, "rfdev_write_simple": write_simple}),
+        RegfileDevSubword(callback={"rfdev_read": mem.__getitem__, "rfdev_write_subword": write_subword}),
+    ):
+        writes.clear()
+        regfile = RegfileMemAccess(rfdev, 0x2000, size=64)
+        regfile[0x8] = 0x1234
+        assert regfile[0x8] == 0x1234
+        assert len(writes) == 1
+
+
+def test_keep_mask_write() -> None:
+    class CountingRegfileDev(RegfileDevSimpleDebug):
+        __slots__ = ("rfdev_write_count",)
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.rfdev_write_count = 0
+
+        def rfdev_write(self, addr: int, value: int, mask: int, write_mask: int) -> None:
+            self.rfdev_write_count += 1
+            super().rfdev_write(addr, value, mask, write_mask)
+
+    for rfdev in (RegfileDevSimpleDebug(), CountingRegfileDev()):
+        regfile = SubmodRegfile(rfdev, 0xF000_0000)
+        regfile["reg1_high"] = {"cfg": 0x12, "cfg_trigger": 1, "cfg_trigger_mode": 2}
+        read_count = rfdev.read_count
+        regfile["reg1_high"]["cfg"] = 0x34
+        assert rfdev.read_count == read_count + 1
+        assert regfile["reg1_high"].get_keep_mask(0xFF) == 0x00030100
+        assert [name for name, _ in regfile["reg1_high"].masked_field_items(0x100)] == ["cfg_trigger"]
+        assert dict(regfile["reg1_high"]) == {"cfg": 0x34, "cfg_trigger": 1, "cfg_trigger_mode": 2}
+
+        if isinstance(rfdev, CountingRegfileDev):
+            assert rfdev.rfdev_write_count == 2
+
+        # reassigned write_mask - the cached keep masks are recomputed
+        regfile["reg1_high"].write_mask = 0x000000FF
+        assert regfile["reg1_high"].get_keep_mask(0xFF) == 0
+        regfile["reg1_high"].write_mask = 0x000301FF
+        assert regfile["reg1_high"].get_keep_mask(0xFF) == 0x00030100
+        read_count = rfdev.read_count
+        regfile["reg1_high"]["cfg"] = 0x56
+        assert rfdev.read_count == read_count + 1
+
+        # the per mask caches are limited
+        for mask in range(1, 1024):
+            regfile["reg1_high"].get_keep_mask(mask)
+            regfile["reg1_high"].masked_field_items(mask)
+        assert len(regfile["reg1_high"]._keep_masks) <= RegisterEntry._MASK_CACHE_MAX
+        assert len(regfile["reg1_high"]._masked_fields) <= RegisterEntry._MASK_CACHE_MAX
+        assert regfile["reg1_high"].get_keep_mask(0xFF) == 0x00030100
+
+
+def test_device_logging(caplog: LogCaptureFixture) -> None:
+    rfdev = RegfileDevSimpleDebug()
+    regfile = SubmodRegfile(rfdev, 0xF000_0000)
+
+    regfile["reg1_low"] = 0x1
+    assert not caplog.records
+
+    rfdev.logger = logging.getLogger("rfdev")
+    with caplog.at_level(logging.DEBUG, logger="rfdev"):
+        regfile["reg1_low"] = 0x2
+    assert "Writing SubmodRegfile@0xf0000000: Register reg1_low = 0x2 & 0xffffffff --> {'cfg': 0x2}" in caplog.messages
+
+    caplog.clear()
+    rfdev.logger = None
+    regfile["reg1_low"] = 0x3
+    assert not caplog.records
+
+
+def test_batch_submit() -> None:
+    mem: dict[int, int] = {}
+    batches: list[tuple[tuple[int, int, int, int], ...]] = []
+
+    def batch_submit(ops: tuple[tuple[int, int, int, int], ...]) -> None:
+        batches.append(ops)
+        for addr, value, _, _ in ops:
+            mem[addr] = value
+
+    rfdev = RegfileDevSimple(
+        callback={"rfdev_read": mem.__getitem__, "rfdev_write_simple": mem.__setitem__, "batch_submit": batch_submit}
+    )
+    regfile = RegfileMemAccess(rfdev, 0x3000, size=64)
+    regfile.write_image(0x10, (1, 2, 3))
+    assert batches == [
+        ((0x3010, 1, 0xFFFFFFFF, 0xFFFFFFFF), (0x3014, 2, 0xFFFFFFFF, 0xFFFFFFFF), (0x3018, 3, 0xFFFFFFFF, 0xFFFFFFFF))
+    ]
+    assert regfile.read_image(0x10, 3) == [1, 2, 3]
+
+
+def test_device_pickle() -> None:
+    rfdev = RegfileDevSubwordDebug()
+    rfdev.rfdev_write(0x100, 0x0500, 0x0F00, 0xFFFF)
+    rfdev_copy = pickle.loads(pickle.dumps(rfdev))
+    assert rfdev_copy.getvalue(0x100) == rfdev.getvalue(0x100)
+
+    rfdev_copy.rfdev_write(0x100, 0xAB0000, 0xFF0000, 0xFFFFFF)
+    assert rfdev_copy.getvalue(0x100) >> 16 & 0xFF == 0xAB
+    assert sorted(rfdev_copy.mem) == sorted(rfdev.mem)
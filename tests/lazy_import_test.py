@@ -0,0 +1,35 @@
+"""Package import tests"""
+
+import os
+import subprocess
+import sys
+
+import regfile_generics
+
+# pylint: disable=missing-function-docstring
+
+
+def _run_python(code: str) -> str:
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(regfile_generics.__file__)))
+    return subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+
+
+def test_lazy_device_import() -> None:
+    code = (
+        "import sys\n"
+        "import regfile_generics\n"
+        "print('regfile_generics.regfile_device' in sys.modules)\n"
+        "regfile_generics.Regfile\n"
+        "print('regfile_generics.regfile_device' in sys.modules)\n"
+        "regfile_generics.RegfileDevSimple\n"
+        "print('regfile_generics.regfile_device' in sys.modules)\n"
+    )
+    assert _run_python(code).split() == ["False", "False", "True"]
+
+
+def test_exports() -> None:
+    for name in regfile_generics.__all__:
+        assert getattr(regfile_generics, name).__name__ == name
+    assert set(regfile_generics.__all__) <= set(dir(regfile_generics))
+    # resolved exports are listed once
+    assert len(dir(regfile_generics)) == len(set(dir(regfile_generics)))
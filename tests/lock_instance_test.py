@@ -18,3 +18,12 @@ def test_regfile_entry_attribute_exception(sessionsubwordregfile: FixtureSubword
         entry.cfg_f = 0xDEAD
     with pytest.raises(Exception):
         regfile.reg1_high_r.cfg_f = 0xDEAD
+
+
+def test_user_attribute_copy(sessionsubwordregfile: FixtureSubwordRegfile):
+    regfile, rfdev = sessionsubwordregfile
+    entry = regfile["reg1_high"].get_reg(0x1)
+    entry.represent(tag="x")
+    entry.tag = "y"
+    assert entry.get_reg(0x0).tag == "y"
+    assert entry.read_entry().tag == "y"
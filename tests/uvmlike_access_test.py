@@ -1,6 +1,9 @@
-from pytest import warns
+from pytest import MonkeyPatch, warns
 
-from .fixtures import FixtureMemAccess, FixtureSimpleRegfile, FixtureSubwordRegfile
+from regfile_generics import RegfileDevSimpleDebug
+from regfile_generics.regfile import RegfileEntry
+
+from .fixtures import FixtureMemAccess, FixtureSimpleRegfile, FixtureSubwordRegfile, SubmodRegfile
 
 # pylint: disable=line-too-long,missing-function-docstring
 
@@ -87,3 +90,21 @@ def test_uvm_write(sessionsubwordregfile: FixtureSubwordRegfile) -> None:
     assert read_count == rfdev.read_count
     assert write_count + 1 == rfdev.write_count
     write_count += 1
+
+
+def test_skip_redundant_writes(monkeypatch: MonkeyPatch) -> None:
+    rfdev = RegfileDevSimpleDebug()
+    regfile = SubmodRegfile(rfdev, 0xF000_0000)
+
+    regfile["reg1_low"] = 0x1234
+    regfile["reg1_low"] = 0x1234
+    assert rfdev.write_count == 2
+
+    monkeypatch.setattr(RegfileEntry, "_skip_redundant_writes", True)
+    regfile["reg1_low"] = 0x1234
+    regfile.reg1_low_r.write_update(cfg=0x1234)
+    assert rfdev.write_count == 2
+
+    regfile["reg1_low"] = 0x4321
+    assert rfdev.write_count == 3
+    assert rfdev.getvalue(0xF000_0004) == 0x4321